@@ -1 +1 @@
-__all__ = ["functions", "events", "elements"]
+__all__ = ["functions", "events", "elements", "replay", "backends"]
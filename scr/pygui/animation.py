@@ -0,0 +1,233 @@
+from weakref import WeakKeyDictionary
+import numpy as np
+import pygame
+from pygui.elements import GUISprite, Button, GUI, K_CENTER, K_LEFT, K_RIGHT
+
+K_EASE_LINEAR = 0
+K_EASE_IN = 1
+K_EASE_OUT = 2
+K_EASE_IN_OUT = 3
+
+K_POSITION = 0
+K_ALPHA = 1
+K_SCALE = 2
+
+# fraction of the width or height between the rect`s top left and the anchor, by alignment
+_ANCHORS = {K_CENTER: 0.5, K_LEFT: 0.0, K_RIGHT: 1.0}
+
+
+class Animator:
+    """moves, fades and scales elements. all active tweens are stored in numpy arrays and advanced together by
+    update, which only writes to the elements that visibly changed. positions are written to the rect directly
+    with the viewport size from the start of the tween, instead of going through set_pos every frame.
+    alpha is set on the image of the element, so elements that share an image also share the alpha.
+    scaled elements get their unscaled image back when they are scaled to 1 again."""
+    __slots__ = ("elements", "rows", "free", "kind", "active", "start", "end", "start_time", "duration", "easing",
+                 "viewport", "anchor", "size", "last", "parent_id", "scale_sources")
+
+    def __init__(self, capacity: int = 64):
+        self.elements = np.full(capacity, None, object)  # element of every row
+        self.rows: dict[tuple[int, int], int] = {}  # (id of element, kind): row
+        self.free: list[int] = list(range(capacity-1, -1, -1))
+        self.kind = np.zeros(capacity, np.int8)
+        self.active = np.zeros(capacity, bool)
+        self.start = np.zeros((capacity, 2))
+        self.end = np.zeros((capacity, 2))
+        self.start_time = np.zeros(capacity)
+        self.duration = np.ones(capacity)
+        self.easing = np.zeros(capacity, np.int8)
+        self.viewport = np.ones((capacity, 2))  # pixels per position unit
+        self.anchor = np.zeros((capacity, 2))  # see _ANCHORS
+        self.size = np.zeros((capacity, 2))  # rect size of the element
+        self.last = np.zeros((capacity, 2))  # last written top left, alpha or size
+        self.parent_id = np.zeros(capacity, np.int64)  # id of the element parent, used to group redraw regions
+        # element: (unscaled image, scale). weak, so removed elements don`t keep their images alive
+        self.scale_sources: WeakKeyDictionary[GUISprite, tuple[pygame.Surface, float]] = WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _grow(self) -> None:
+        capacity = len(self.elements)
+        self.free.extend(range(capacity*2-1, capacity-1, -1))
+        for name in ("elements", "kind", "active", "start", "end", "start_time", "duration", "easing", "viewport",
+                     "anchor", "size", "last", "parent_id"):
+            array = getattr(self, name)
+            grown = np.full((capacity*2, *array.shape[1:]), None if array.dtype == object else 0, array.dtype)
+            grown[:capacity] = array
+            setattr(self, name, grown)
+
+    def _add(self, element: GUISprite, kind: int, start: tuple[float, float], end: tuple[float, float],
+             duration: int, easing: int, now: int | None) -> int:
+        row = self.rows.get((id(element), kind))
+        if row is None:
+            if not self.free:
+                self._grow()
+            row = self.free.pop()
+            self.rows[(id(element), kind)] = row
+            self.elements[row] = element
+        self.kind[row] = kind
+        self.active[row] = True
+        self.start[row] = start
+        self.end[row] = end
+        self.start_time[row] = pygame.time.get_ticks() if now is None else now
+        self.duration[row] = max(duration, 1)
+        self.easing[row] = easing
+        self.size[row] = element.rect.size
+        self.parent_id[row] = id(element.parent)
+        return row
+
+    def move(self, element: GUISprite, pos: tuple[int | float, int | float], duration: int,
+             easing: int = K_EASE_LINEAR, now: int | None = None) -> None:
+        """moves the element from its current position to pos in duration ms. pos uses the same units as set_pos"""
+        row = self._add(element, K_POSITION, element.pos, pos, duration, easing, now)
+        if element.uses_viewport:
+            self.viewport[row] = element.pixels_from_viewport((1.0, 1.0))
+        else:
+            self.viewport[row] = (1.0, 1.0)
+        self.anchor[row] = (_ANCHORS[element.alignment[0]], _ANCHORS[element.alignment[1]])
+        self.last[row] = element.rect.topleft
+
+    def fade(self, element: GUISprite, alpha: int, duration: int, easing: int = K_EASE_LINEAR,
+             now: int | None = None) -> None:
+        """changes the alpha of the element image to alpha in duration ms"""
+        current = element.image.get_alpha()
+        current = 255 if current is None else current
+        row = self._add(element, K_ALPHA, (current, 0), (alpha, 0), duration, easing, now)
+        self.last[row] = (current, 0)
+
+    def scale(self, element: GUISprite, scale: float, duration: int, easing: int = K_EASE_LINEAR,
+              now: int | None = None) -> None:
+        """scales the element to scale times its size at the first call of scale in duration ms"""
+        source, current = self.scale_sources.setdefault(element, (element.image.copy(), 1.0))
+        row = self._add(element, K_SCALE, (current, 0), (scale, 0), duration, easing, now)
+        self.size[row] = source.get_size()  # sizes are calculated from the unscaled image
+        self.last[row] = element.rect.size
+
+    def stop(self, element: GUISprite) -> None:
+        """stops every tween of the element where it is now"""
+        for kind in (K_POSITION, K_ALPHA, K_SCALE):
+            row = self.rows.pop((id(element), kind), None)
+            if row is not None:
+                self._release(row)
+        self.scale_sources.pop(element, None)
+
+    def _release(self, row: int) -> None:
+        self.active[row] = False
+        self.elements[row] = None
+        self.free.append(row)
+
+    def update(self, now: int | None = None) -> list[pygame.Rect]:
+        """advances every tween and returns the window areas that have to be redrawn. moved elements get one area
+        per parent, faded and scaled elements one area each"""
+        rows = np.flatnonzero(self.active)
+        if not rows.size:
+            return []
+        now = pygame.time.get_ticks() if now is None else now
+        progress = np.clip((now-self.start_time[rows])/self.duration[rows], 0.0, 1.0)
+        easing = self.easing[rows]
+        progress = np.select((easing == K_EASE_IN, easing == K_EASE_OUT, easing == K_EASE_IN_OUT),
+                             (progress*progress, progress*(2.0-progress), progress*progress*(3.0-2.0*progress)),
+                             progress)
+        # lands exactly on end when progress is 1, unlike start + (end-start)*progress
+        values = self.start[rows]*(1.0-progress[:, None]) + self.end[rows]*progress[:, None]
+
+        kind = self.kind[rows][:, None]
+        # what ends up on screen: top left for positions, alpha and size
+        position = np.trunc(values*self.viewport[rows])
+        offset = np.where(self.anchor[rows] == 0.5, self.size[rows]//2, self.anchor[rows]*self.size[rows])
+        shown = np.where(kind == K_POSITION, position-offset,
+                         np.where(kind == K_ALPHA, np.round(values), np.round(values[:, :1]*self.size[rows])))
+        previous = self.last[rows]
+        changed = np.any(shown != previous, axis=1)
+        self.last[rows] = shown
+        finished = progress >= 1.0
+        is_position = kind[:, 0] == K_POSITION
+
+        # python lists are a lot faster to loop over than numpy arrays
+        written = np.flatnonzero((changed | finished) & is_position)
+        for element, pos, topleft in zip(self.elements[rows[written]].tolist(), values[written].tolist(),
+                                         shown[written].tolist()):
+            element.pos = tuple(pos)
+            element.rect.topleft = topleft
+
+        dirty = []
+        for i in np.flatnonzero((changed | finished) & ~is_position).tolist():
+            element = self.elements[rows[i]]
+            old_rect = element.rect.copy()
+            if kind[i, 0] == K_ALPHA:
+                element.image.set_alpha(int(shown[i, 0]))
+            else:
+                self._write_scale(element, float(values[i, 0]), shown[i].tolist())
+            if changed[i]:
+                dirty.append(old_rect.union(element.rect).move(self._content_origin(element.parent)))
+
+        # one region per parent that covers the old and new rects of everything that moved in it
+        moved = np.flatnonzero(changed & is_position)
+        if moved.size:
+            left_top = np.minimum(previous[moved], shown[moved])
+            right_bottom = np.maximum(previous[moved], shown[moved])+self.size[rows[moved]]
+            parent_ids = self.parent_id[rows[moved]]
+            for parent_id in np.unique(parent_ids).tolist():
+                group = parent_ids == parent_id
+                x, y = left_top[group].min(axis=0).tolist()
+                right, bottom = right_bottom[group].max(axis=0).tolist()
+                origin = self._content_origin(self.elements[rows[moved[group][0]]].parent)
+                dirty.append(pygame.Rect(x+origin[0], y+origin[1], right-x, bottom-y))
+
+        for row, row_kind in zip(rows[finished].tolist(), kind[finished, 0].tolist()):
+            element = self.elements[row]
+            del self.rows[(id(element), row_kind)]
+            self._release(row)
+            if row_kind == K_SCALE and self.end[row, 0] == 1.0:
+                self._restore_scale(element)
+        return dirty
+
+    @staticmethod
+    def _content_origin(parent: GUISprite | None) -> tuple[int, int]:
+        """the window position children of parent are positioned from. same walk as get_global_rect"""
+        x = y = 0
+        while parent is not None:
+            content = parent.content_rect()
+            x += content.left
+            y += content.top
+            parent = parent.parent
+        return x, y
+
+    def _restore_scale(self, element: GUISprite) -> None:
+        """gives an element that is back at its unscaled size its source image and forgets the source"""
+        source, _scale = self.scale_sources.pop(element)
+        if not isinstance(element, GUI) and element.rect.size == source.get_size():
+            source.set_alpha(element.image.get_alpha())  # keep what fade set
+            element.image = source
+            if isinstance(element, Button):
+                element.mask = pygame.mask.from_surface(element.image, 0)
+
+    def _write_scale(self, element: GUISprite, scale: float, size: list[float]) -> None:
+        source, _scale = self.scale_sources[element]
+        self.scale_sources[element] = (source, scale)
+        size = (max(int(size[0]), 1), max(int(size[1]), 1))
+        if size == element.rect.size:
+            return
+        if isinstance(element, GUI):  # the background has to be scaled as well
+            element.resize(size)
+            return
+        # keep the anchor of the alignment in place
+        anchor = (_ANCHORS[element.alignment[0]], _ANCHORS[element.alignment[1]])
+        x = element.rect.left+round(element.rect.width*anchor[0])
+        y = element.rect.top+round(element.rect.height*anchor[1])
+        if source.get_bitsize() >= 24:
+            element.image = pygame.transform.smoothscale(source, size)
+        else:
+            element.image = pygame.transform.scale(source, size)
+        element.rect.update(x-round(size[0]*anchor[0]), y-round(size[1]*anchor[1]), *size)
+        if isinstance(element, Button):
+            element.mask = pygame.mask.from_surface(element.image, 0)
+        position_row = self.rows.get((id(element), K_POSITION))
+        if position_row is not None:  # moves use the new size from now on
+            self.size[position_row] = size
+            self.last[position_row] = element.rect.topleft
+
+
+__all__ = ["Animator", "K_EASE_LINEAR", "K_EASE_IN", "K_EASE_OUT", "K_EASE_IN_OUT", "K_POSITION", "K_ALPHA",
+           "K_SCALE"]
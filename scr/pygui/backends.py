@@ -0,0 +1,127 @@
+from typing import Protocol
+import pygame
+from pygui.functions import surface_version
+
+
+class RenderBackend(Protocol):
+    """what Screen needs from a backend"""
+    def get_surface(self) -> pygame.Surface:
+        """returns the surface the screen uses as its image"""
+
+    def set_mode(self, size: tuple[int, int] = (0, 0), flags: int = 0) -> pygame.Surface:
+        """changes the window size or fullscreen mode and returns the new surface"""
+
+    def draw(self, screen) -> None:
+        """draws the screen and everything in it"""
+
+    def flip(self) -> None:
+        """shows what was drawn"""
+
+
+class TextureBackend(RenderBackend, Protocol):
+    """backend that draws every surface directly to the window. used by the render methods of the elements"""
+    def set_clip(self, rect: pygame.Rect) -> None:
+        """only draw inside the given area of the window"""
+
+    def copy(self, surface: pygame.Surface, pos: tuple[int, int], area: pygame.Rect | None = None) -> None:
+        """draws the surface at the given window position. area is the part of the surface to draw"""
+
+
+class SurfaceBackend:
+    """draws the screen by blitting everything into the display surface. the default backend of Screen"""
+    __slots__ = ()
+
+    def get_surface(self) -> pygame.Surface:
+        return pygame.display.get_surface()
+
+    def set_mode(self, size: tuple[int, int] = (0, 0), flags: int = 0) -> pygame.Surface:
+        return pygame.display.set_mode(size, flags)
+
+    def draw(self, screen) -> None:
+        screen.filled_surface()
+
+    def flip(self) -> None:
+        pygame.display.flip()
+
+
+class RendererBackend:
+    """draws the screen with a SDL2 renderer. every surface is uploaded once as a texture and drawn with
+    texture copies, which SDL batches. uses a hardware renderer when there is one, otherwise the software renderer.
+    SDL can`t put a renderer on the window of pygame.display, so don`t call pygame.display.set_mode and pass a
+    surface of the window size to pygui.events.init instead. without a display mode the pygui functions like get_img
+    and to_display_format leave surfaces unconverted, which textures don`t need, and CHECK_FORMATS has nothing to
+    check. surfaces that are drawn on after they were drawn by the backend are uploaded again when they are marked
+    with functions.mark_changed."""
+    __slots__ = ("window", "renderer", "textures", "used_textures", "surface", "origin")
+
+    def __init__(self, size: tuple[int, int], title: str = "pygame window", accelerated: int = -1,
+                 vsync: bool = False, resizable: bool = True):
+        from pygame._sdl2 import video  # not every pygame build has the sdl2 module
+        self.window = video.Window(title, size, resizable=resizable)
+        # accelerated: -1 uses whatever is available, 0 forces the software renderer, 1 requires hardware
+        self.renderer = video.Renderer(self.window, accelerated=accelerated, vsync=vsync)
+        # id of surface: (surface, texture, version of the surface when it was uploaded)
+        self.textures: dict[int, tuple[pygame.Surface, video.Texture, int]] = {}
+        self.used_textures: dict[int, tuple[pygame.Surface, video.Texture, int]] = {}  # textures drawn this frame
+        self.surface = pygame.Surface(size)  # stands in for the display surface, nothing is drawn on it
+        self.origin = (0, 0)  # top left of the current viewport
+
+    def get_surface(self) -> pygame.Surface:
+        if self.surface.get_size() != self.window.size:
+            self.surface = pygame.Surface(self.window.size)
+        return self.surface
+
+    def set_mode(self, size: tuple[int, int] = (0, 0), flags: int = 0) -> pygame.Surface:
+        if flags & pygame.FULLSCREEN:
+            self.window.set_fullscreen(True)
+        else:
+            self.window.set_windowed()
+            if size != (0, 0):
+                self.window.size = size
+        return self.get_surface()
+
+    def get_texture(self, surface: pygame.Surface):
+        """returns the texture of the surface. only uploads surfaces that are new or changed since last frame"""
+        key = id(surface)
+        entry = self.used_textures.get(key)
+        if entry is None:
+            entry = self.textures.get(key)
+        version = surface_version(surface)
+        if entry is None or entry[0] is not surface:
+            from pygame._sdl2 import video
+            entry = (surface, video.Texture.from_surface(self.renderer, surface), version)
+        elif entry[2] != version:
+            entry[1].update(surface)
+            entry = (surface, entry[1], version)
+        self.used_textures[key] = entry
+        return entry[1]
+
+    def set_clip(self, rect: pygame.Rect) -> None:
+        """only draw inside the given area of the window"""
+        self.renderer.set_viewport(rect)
+        self.origin = rect.topleft
+
+    def copy(self, surface: pygame.Surface, pos: tuple[int, int], area: pygame.Rect | None = None) -> None:
+        """draws the surface at the given window position. area is the part of the surface to draw"""
+        size = surface.get_size() if area is None else area.size
+        texture = self.get_texture(surface)
+        # the surface alpha is applied by the texture, so changing it doesn`t need a new upload
+        alpha = surface.get_alpha()
+        texture.alpha = 255 if alpha is None else alpha
+        if texture.alpha < 255 and texture.blend_mode == 0:  # surfaces without per pixel alpha don`t blend
+            texture.blend_mode = 1
+        texture.draw(area, pygame.Rect(pos[0]-self.origin[0], pos[1]-self.origin[1], *size))
+
+    def draw(self, screen) -> None:
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.set_viewport(None)
+        self.renderer.clear()
+        screen.render(self, (0, 0), screen.rect)
+        # textures that were not drawn this frame are released
+        self.textures, self.used_textures = self.used_textures, {}
+
+    def flip(self) -> None:
+        self.renderer.present()
+
+
+__all__ = ["RenderBackend", "TextureBackend", "SurfaceBackend", "RendererBackend"]
@@ -1,6 +1,9 @@
 import pygame
+import warnings
 from collections.abc import Sequence
-from pygui.functions import center_text, colored_rect
+from pygui.functions import center_text, colored_rect, surface_bytes, to_display_format, is_display_format, \
+    scale_surface, mouse_pos, mark_changed, K_SCALE_STRETCH, K_SCALE_CENTER, K_SCALE_NONE
+from pygui.backends import RenderBackend, TextureBackend, SurfaceBackend
 from math import floor, ceil
 
 pygame.font.init()
@@ -23,8 +26,13 @@ K_TOP_RIGHT = (K_RIGHT, K_TOP)
 K_BOTTOM_LEFT = (K_LEFT, K_BOTTOM)
 K_BOTTOM_RIGHT = (K_RIGHT, K_BOTTOM)
 
+CHECK_FORMATS = False  # debug option. warns when surfaces that are not in the display format are drawn
+BACKGROUND_CACHE_SIZE = 4  # scaled backgrounds kept per gui. the least recently used one is removed first
+
 
 class GUISprite(pygame.sprite.Sprite):
+    __slots__ = ("image", "pos", "rect", "name", "priority", "parent", "uses_viewport", "alignment")
+
     def __init__(self, pos: tuple[int | float, int | float], image: pygame.Surface, priority: int = 5,
                  name: str = "sprite", use_viewport: bool = True, alignment: Sequence[int, int] = K_ALIGN_CENTER,
                  *groups: pygame.sprite.Group):
@@ -77,9 +85,12 @@ class GUISprite(pygame.sprite.Sprite):
         """transform viewport coordenates to pixels"""
         if viewport_size is None:
             if self.parent is None:
-                viewport_size = pygame.display.get_window_size()
+                try:
+                    viewport_size = pygame.display.get_window_size()
+                except pygame.error:  # no display window, e.g. with RendererBackend. updated when added to a gui
+                    viewport_size = (0, 0)
             else:
-                viewport_size = self.parent.rect.size
+                viewport_size = self.parent.content_rect().size
         return int(pos[0]*viewport_size[0]), int(pos[1]*viewport_size[1])
 
     def get_global_rect(self) -> pygame.rect.Rect:
@@ -87,10 +98,18 @@ class GUISprite(pygame.sprite.Sprite):
         parent = self.parent
         rect = self.rect.copy()
         while parent is not None:
-            rect.move_ip(parent.rect.topleft)
+            rect.move_ip(parent.content_rect().topleft)
             parent = parent.parent
         return rect
 
+    def content_rect(self) -> pygame.rect.Rect:
+        """the area children are positioned in, relative to the parent of this sprite"""
+        return self.rect
+
+    def drawn_rect(self) -> pygame.rect.Rect:
+        """the area the sprite draws to, relative to its parent content. used to cull drawing and hit testing"""
+        return self.rect
+
     def set_surface(self, image: pygame.surface.Surface):
         """set a new surface to be displayed"""
         self.image = image
@@ -100,6 +119,11 @@ class GUISprite(pygame.sprite.Sprite):
     def filled_surface(self) -> pygame.surface.Surface:
         return self.image
 
+    def render(self, backend: TextureBackend, origin: tuple[int, int], clip: pygame.Rect) -> None:
+        """draws the sprite with a backend that draws surfaces directly to the window, like RendererBackend.
+        origin is the window position of the parent content, clip the visible area of the parent"""
+        backend.copy(self.filled_surface(), (self.rect.left+origin[0], self.rect.top+origin[1]))
+
     def viewport_to_pixels(self, pos: Sequence[float, float], viewport: Sequence[int | float, int | float] | None =
                            None, alignment: Sequence[int | None, int | None] | None = None):
         """deprecated! translate viewport coordenates to pixel position for flexible displays."""
@@ -132,29 +156,51 @@ class GUISprite(pygame.sprite.Sprite):
         self.rect.update(bounds.move(self.rect.topleft))
         self.image = self.image.subsurface(bounds).copy()
 
+    def memory_usage(self, seen: set[int] | None = None) -> int:
+        """returns the amount of bytes used by the surfaces of this element. surfaces in seen are not counted again"""
+        return surface_bytes(self.image, seen)
+
+    def convert_surfaces(self) -> None:
+        """converts the stored surfaces to the current display format. called after the display mode changes"""
+        self.image = to_display_format(self.image)
+
 
 class Button(GUISprite):
+    __slots__ = ("mask", "action", "on_hover", "on_press", "on_unfocus", "active")
+
     def __init__(self, pos: tuple[int | float, int | float], image: pygame.Surface, action, priority=15, name="button",
                  use_viewport: bool = True, alignment: Sequence[int, int] = K_ALIGN_CENTER, hover=None,
                  press=None, unfocused=None, *groups: pygame.sprite.Group):
         super().__init__(pos, image, priority, name, use_viewport, alignment, *groups)
         self.mask = pygame.mask.from_surface(image, 0)
 
-        self.click = action
-        self.hover = self.placeholder if hover is None else hover
-        self.press = self.placeholder if press is None else press
-        self.lost_focus = self.placeholder if unfocused is None else unfocused
+        self.action = action
+        self.on_hover = hover
+        self.on_press = press
+        self.on_unfocus = unfocused
         self.active = False
 
+    def click(self):
+        if self.action is not None:
+            self.action()
+
+    def hover(self):
+        if self.on_hover is not None:
+            self.on_hover()
+
+    def press(self):
+        if self.on_press is not None:
+            self.on_press()
+
+    def lost_focus(self):
+        if self.on_unfocus is not None:
+            self.on_unfocus()
+
     def is_hit(self, pos: Sequence[int, int]) -> bool:
         """checks if the given position is hovering over the bitmap"""
         hit_point = (pos[0]-self.rect.left, pos[1]-self.rect.top)
         return bool(self.rect.collidepoint(pos) and self.mask.get_at(hit_point))
 
-    @staticmethod
-    def placeholder():
-        pass
-
     still_focused = is_hit
 
     def fit_to_image(self, threshold=1):
@@ -168,12 +214,16 @@ class Button(GUISprite):
 class TextBox(Button):
     """simple textbox object. when added to gui as sprite it can be used as a simpel display for varias values.
     when added as a button it can handle input when clicked."""
+    __slots__ = ("text", "cursor", "cursor_pos", "cursor_selected", "blink_speed", "text_alignment", "text_pos", "font",
+                 "color", "last_action", "whitelist", "blacklist", "on_enter", "selected", "offset", "text_surface",
+                 "rendered_text", "composed", "composed_state")
+
     def __init__(self, pos: tuple[int | float, int | float], image: pygame.Surface, action, font=DEFAULT_FONT,
                  priority=15, name="textbox", use_viewport: bool = True, alignment: Sequence[int, int] = K_ALIGN_CENTER,
                  hover=None, text="", color=(255, 255, 255), text_alignment=0, spacing=(5.0, 0.5),
                  whitelist: Sequence[str] | set[str] = (), blacklist: Sequence[str] | set[str] = (), press=None,
                  *groups: pygame.sprite.Group):
-        super().__init__(pos, image, self.start_input, priority, name, use_viewport, alignment, hover, self.on_press, None, *groups)
+        super().__init__(pos, image, None, priority, name, use_viewport, alignment, hover, None, None, *groups)
         self.text: str = text
         self.cursor: int = 0  # letter position. before the first letter = 0
         self.cursor_pos: int | float = 0.0  # x sprite position of cursor
@@ -189,8 +239,12 @@ class TextBox(Button):
         self.on_enter = action
         self.selected = press
         self.offset: int = 0
+        self.text_surface: pygame.Surface | None = None  # cached render of rendered_text
+        self.rendered_text: tuple[str, tuple[int, int, int], pygame.font.Font] | None = None
+        self.composed: pygame.Surface | None = None  # last result of filled_surface
+        self.composed_state: tuple | None = None  # everything composed depends on
 
-    def on_press(self):
+    def press(self):
         self.cursor, self.cursor_pos = self.cursor_from_mouse()
         self.cursor_selected[0] = self.cursor
 
@@ -212,9 +266,11 @@ class TextBox(Button):
         elif (self.cursor_selected[0]+self.cursor_selected[1]) >= len(self.text):
             self.cursor_selected[1] = len(self.text) - self.cursor_selected[0]
 
+    click = start_input
+
     def cursor_from_mouse(self) -> tuple[int, int | float]:
         rect = self.get_text_rect()
-        x, y = pygame.mouse.get_pos()
+        x, y = mouse_pos()
         global_x, global_y = self.get_global_rect().topleft
         x, y = x-global_x, y-global_y
         width = rect.x
@@ -335,11 +391,44 @@ class TextBox(Button):
     def stop(self):
         self.handle_input("", pygame.K_RETURN)
 
+    def get_text_surface(self) -> pygame.Surface:
+        """returns the rendered text. only renders again when the text, color or font changed"""
+        if self.rendered_text != (self.text, self.color, self.font):
+            self.rendered_text = (self.text, self.color, self.font)
+            self.text_surface = to_display_format(self.font.render(self.text, True, self.color))
+        return self.text_surface
+
+    def convert_surfaces(self) -> None:
+        super().convert_surfaces()
+        self.rendered_text = None
+        self.composed_state = None
+
+    def memory_usage(self, seen: set[int] | None = None) -> int:
+        """returns the amount of bytes used by the surfaces of this element, including the cached text and
+        composed surfaces. surfaces in seen are not counted again"""
+        if seen is None:
+            seen = set()
+        total = surface_bytes(self.image, seen)
+        if self.text_surface is not None:
+            total += surface_bytes(self.text_surface, seen)
+        if self.composed is not None:
+            total += surface_bytes(self.composed, seen)
+        return total
+
     def filled_surface(self) -> pygame.surface.Surface:
-        blit_surface = self.image.copy()
+        """returns the image with the text, selection and cursor. only composed again when one of them changed,
+        so the same surface is returned while nothing changes"""
+        cursor_visible = self.active and ((pygame.time.get_ticks()-self.last_action)//500) % 2 == 0
+        state = (self.image, self.rect.size, self.text, self.color, self.font, self.offset, self.text_pos,
+                 self.text_alignment, self.active, tuple(self.cursor_selected), self.cursor_pos, cursor_visible)
+        if state == self.composed_state:
+            self.composed.set_alpha(self.image.get_alpha())  # a fade changes the alpha of the image only
+            return self.composed
+        self.composed_state = state
+        blit_surface = self.composed = self.image.copy()
         pos = self.get_text_rect().move(-self.offset, 0).topleft
         if self.text:
-            blit_surface.blit(self.font.render(self.text, True, self.color), pos)
+            blit_surface.blit(self.get_text_surface(), pos)
         if self.active:
             if self.cursor_selected[1] > 0:
                 x = self.get_cursor_pos(self.cursor_selected[0])
@@ -347,7 +436,7 @@ class TextBox(Button):
                 selection_surface = colored_rect((50, 50, 255), (w, floor(self.rect.h*0.9)))
                 selection_surface.set_alpha(150)
                 blit_surface.blit(selection_surface, (x, ceil(self.rect.h*0.05)))
-            if ((pygame.time.get_ticks()-self.last_action)//500) % 2 == 0:
+            if cursor_visible:
                 # draw cursor
                 blit_surface.blit(colored_rect((255, 255, 255), (3, floor(self.rect.h*0.9))),
                                   (self.cursor_pos-1-self.offset, ceil(self.rect.h*0.05)))
@@ -356,11 +445,14 @@ class TextBox(Button):
 
 
 class Dropdown(Button):
+    __slots__ = ("buttons", "buttons_sprite", "options", "option_surface", "scroll", "max_scroll", "scroll_speed",
+                 "selected")
+
     def __init__(self, pos: tuple[int | float, int | float], image: pygame.Surface, option_image: pygame.Surface,
                  priority=15, name="dropdown", use_viewport: bool = True,
                  alignment: Sequence[int, int] = K_ALIGN_CENTER, hover=None, press=None,
                  options: list[Sequence[str, None]] = (), *groups: pygame.sprite.Group):
-        super().__init__(pos, image, self.open, priority, name, use_viewport, alignment, hover, press, None, *groups)
+        super().__init__(pos, image, None, priority, name, use_viewport, alignment, hover, press, None, *groups)
         self.buttons: list[Button] = []
         self.buttons_sprite: GUISprite | None = None
         self.options = options
@@ -368,6 +460,13 @@ class Dropdown(Button):
         self.scroll = 0.0
         self.max_scroll = 0.0
         self.scroll_speed = 1.0
+        self.selected: Button | None = None  # option that gets clicked instead of opening the list
+
+    def click(self):
+        if self.selected is None:
+            self.open()
+        else:
+            self.selected.click()
 
     def open(self):
         """folds out the list"""
@@ -377,17 +476,17 @@ class Dropdown(Button):
         if not len(self.options):
             return
         rect = pygame.rect.Rect((0, 0), self.option_surface.get_size())
-        surf = pygame.Surface((rect.width, rect.height*len(self.options)), pygame.SRCALPHA)
+        surf = to_display_format(pygame.Surface((rect.width, rect.height*len(self.options)), pygame.SRCALPHA))
 
         for option in self.options:
             button = Button(rect.topleft, center_text(option[0], self.option_surface, LIST_FONT), option[1],
-                            name="option")
+                            name="option", use_viewport=False, alignment=K_TOP_LEFT)
             button.parent = self
             self.buttons.append(button)
             surf.blit(button.filled_surface(), rect.topleft)
             rect.topleft = button.rect.bottomleft
 
-        self.buttons_sprite = GUISprite((0, 0), surf)
+        self.buttons_sprite = GUISprite((0, 0), surf, use_viewport=False, alignment=K_TOP_LEFT)
         self.max_scroll = self.buttons_sprite.rect.height-self.buttons[0].rect.height
         self.scroll_speed = self.buttons[0].rect.height/4.0
         self.active = True
@@ -398,7 +497,7 @@ class Dropdown(Button):
         self.scroll_speed = 1.0
         self.buttons_sprite = None
         self.active = False
-        self.click = self.open
+        self.selected = None
 
     stop = close
 
@@ -411,23 +510,40 @@ class Dropdown(Button):
     def filled_surface(self) -> pygame.surface.Surface:
         if self.active and self.buttons_sprite is not None and self.parent is not None:
             rect = self.buttons_sprite.rect.move(0, int(self.scroll))
-            rect.height -= self.scroll
+            rect.height -= int(self.scroll)
+            content = self.parent.content_rect()  # the parent might be scrolled
             self.parent.image.blit(self.buttons_sprite.image.subsurface(rect),
-                                   self.rect.move(0, self.rect.height).topleft)
+                                   self.rect.move(content.x-self.parent.rect.x,
+                                                  content.y-self.parent.rect.y+self.rect.height).topleft)
 
         return self.image
 
+    def render(self, backend: TextureBackend, origin: tuple[int, int], clip: pygame.Rect) -> None:
+        backend.copy(self.image, (self.rect.left+origin[0], self.rect.top+origin[1]))
+        if self.active and self.buttons_sprite is not None:
+            rect = self.buttons_sprite.rect.move(0, int(self.scroll))
+            rect.height -= int(self.scroll)
+            backend.copy(self.buttons_sprite.image, (self.rect.left+origin[0], self.rect.bottom+origin[1]), rect)
+
+    def drawn_rect(self) -> pygame.rect.Rect:
+        """the dropdown and the open list below it"""
+        if not self.active or self.buttons_sprite is None:
+            return self.rect
+        return self.rect.union((self.rect.left, self.rect.bottom, self.buttons_sprite.rect.width,
+                                self.buttons_sprite.rect.height-int(self.scroll)))
+
     def is_hit(self, pos: tuple[int, int]) -> bool:
         """checks if the given position is hovering over the bitmap"""
         hit_point = [pos[0]-self.rect.left, pos[1]-self.rect.top]
         if self.rect.collidepoint(pos) and self.mask.get_at(hit_point):
+            self.selected = None
             return True
         elif not self.active:
             return False
         hit_point[1] -= self.rect.height-int(self.scroll)
         for button in self.buttons:
             if button.is_hit(hit_point):
-                self.click = button.click
+                self.selected = button
                 return True
         return False
 
@@ -441,17 +557,39 @@ class Dropdown(Button):
         hit_point[1] -= self.rect.height-int(self.scroll)
         for button in self.buttons:
             if button.is_hit(hit_point):
-                return button.click is self.click
+                return button is self.selected
         return False
 
+    def memory_usage(self, seen: set[int] | None = None) -> int:
+        """returns the amount of bytes used by the surfaces of this element. surfaces in seen are not counted again"""
+        if seen is None:
+            seen = set()
+        total = surface_bytes(self.image, seen) + surface_bytes(self.option_surface, seen)
+        if self.buttons_sprite is not None:
+            total += self.buttons_sprite.memory_usage(seen)
+        return total + sum(button.memory_usage(seen) for button in self.buttons)
+
+    def convert_surfaces(self) -> None:
+        super().convert_surfaces()
+        self.option_surface = to_display_format(self.option_surface)
+        if self.buttons_sprite is not None:
+            self.buttons_sprite.convert_surfaces()
+        for button in self.buttons:
+            button.convert_surfaces()
+
 
 class GUI(GUISprite):
+    __slots__ = ("_background", "source_image", "mask", "buttons", "sub_GUIs", "sprites", "focus", "active",
+                 "scale_mode", "background_color", "background_cache")
+
     def __init__(self, pos: tuple[int | float, int | float], background: pygame.Surface, priority=25, name="gui",
                  use_viewport: bool = True, alignment: Sequence[int, int] = K_ALIGN_CENTER,
                  *groups: pygame.sprite.Group):
         super().__init__(pos, background, priority, name, use_viewport, alignment, *groups)
-        self.background = background.copy()  # background used during drawing routine
         self.source_image = background.copy()  # original image. used to reset background
+        # background used during drawing routine. shares the source image until it is modified (copy on write),
+        # use the background property or own_background to get a version that can be drawn on
+        self._background = self.source_image
         self.mask = pygame.mask.from_surface(background, 0)
         self.buttons: list[Button | TextBox | Dropdown] = []  # contains the buttons, used for button operations
         self.sub_GUIs: list[GUI] = []  # contains sub menus, used for menu operations
@@ -459,27 +597,139 @@ class GUI(GUISprite):
         self.sprites: list[GUISprite | Button | GUI | TextBox | Dropdown] = []
         self.focus: TextBox | Dropdown | Button | GUI | None = None
         self.active = False
+        self.scale_mode = K_SCALE_STRETCH  # how the source image is scaled when the gui has a different size
+        self.background_color = (0, 0, 0)  # used for the areas the scaled source image does not cover
+        # scaled versions of the source image stored by (width, height, scale mode, background color).
+        # least recently used first
+        self.background_cache: dict[tuple[int, int, int, tuple], pygame.Surface] = {}
 
     def bake_background(self):
         """bake elements to the background surface and removes them from the sprites list.
         usufull for reducing the amount of blitting calls"""
-        self.background = self.filled_surface().copy()
+        self._background = self.filled_surface().copy()
         self.sprites.clear()
 
     def clear_background(self):
         """resets the background to normal. GUI.clear will also reset the background"""
-        self.background = self.source_image.copy()
+        self._background = self.scaled_background(self.rect.size)
+
+    def own_background(self) -> pygame.Surface:
+        """returns a background that can be drawn on without changing the source image or a cached background"""
+        if self._background is self.source_image or any(self._background is surface
+                                                        for surface in self.background_cache.values()):
+            self._background = self._background.copy()
+        mark_changed(self._background)  # the caller is about to draw on it
+        return self._background
+
+    @property
+    def background(self) -> pygame.Surface:
+        """the background used during drawing. it is copied before it is returned if it is still shared,
+        so it can be drawn on"""
+        return self.own_background()
+
+    @background.setter
+    def background(self, background: pygame.Surface) -> None:
+        self._background = background
+
+    def scaled_background(self, size: Sequence[int, int], mode: int | None = None) -> pygame.Surface:
+        """returns the source image scaled to the given size. the result is cached, so don`t draw on it"""
+        if mode is None:
+            mode = self.scale_mode
+        if tuple(size) == self.source_image.get_size():
+            return self.source_image
+        key = (size[0], size[1], mode, tuple(self.background_color))
+        try:
+            surface = self.background_cache.pop(key)
+        except KeyError:
+            surface = scale_surface(self.source_image, size, mode, self.background_color)
+            if len(self.background_cache) >= BACKGROUND_CACHE_SIZE:
+                del self.background_cache[next(iter(self.background_cache))]
+        self.background_cache[key] = surface  # (re)insert as most recently used
+        return surface
+
+    def resize(self, size: Sequence[int, int]) -> None:
+        """changes the size of the gui. the background is scaled using the scale mode"""
+        self._background = self.scaled_background(size)
+        self.image = self._background.copy()
+        self.mask = pygame.mask.from_surface(self._background, 0)
+        self.rect.update(self.rect.left, self.rect.top, size[0], size[1])
+        self._update_pos()
+        for sprite in self.sprites:
+            sprite._update_pos()
 
     def filled_surface(self) -> pygame.Surface:
-        """returns a surface filled with all the elements."""
-        self.image.blit(self.background, (0, 0))
+        """returns a surface filled with all the elements. sprites outside the gui are skipped."""
+        self.image.blit(self._background, (0, 0))
+        visible = self.visible_sprites(self.sprites)
         # recursive calls till the end is reached.
-        self.image.blits([(sprite.filled_surface(), sprite.rect.topleft) for sprite in self.sprites], False)
+        blits = [(sprite.filled_surface(), sprite.rect.topleft) for sprite in visible]
+        if CHECK_FORMATS:
+            self.check_formats(visible, blits)
+        self.image.blits(blits, False)
         return self.image
 
+    def render(self, backend: TextureBackend, origin: tuple[int, int], clip: pygame.Rect) -> None:
+        """draws the background and the visible elements with a backend that draws directly to the window"""
+        rect = self.rect.move(origin)
+        clip = rect.clip(clip)
+        if not clip.width or not clip.height:
+            return
+        backend.set_clip(clip)
+        alpha = self.image.get_alpha()
+        if alpha is not None and alpha < 255:
+            # the elements have to fade with the gui, so it is composed into its image and drawn as one texture
+            surface = self.filled_surface()
+            mark_changed(surface)
+            backend.copy(surface, rect.topleft)
+            return
+        backend.copy(self._background, rect.topleft)
+        content = self.content_rect()
+        content_origin = (content.left+origin[0], content.top+origin[1])
+        for sprite in self.sprites:
+            if sprite.drawn_rect().move(content_origin).colliderect(clip):
+                sprite.render(backend, content_origin, clip)
+                if isinstance(sprite, GUI):  # sub guis change the clip area
+                    backend.set_clip(clip)
+
+    def visible_rect(self) -> pygame.rect.Rect:
+        """the visible area in the coordinates children are positioned in"""
+        return pygame.Rect((0, 0), self.rect.size)
+
+    def visible_sprites(self, sprites: Sequence[GUISprite]) -> list:
+        """returns the sprites that draw inside the visible area. the others are neither drawn nor hit"""
+        bounds = self.visible_rect()
+        return [sprite for sprite in sprites if sprite.drawn_rect().colliderect(bounds)]
+
+    def check_formats(self, sprites: Sequence[GUISprite], blits: Sequence[tuple[pygame.Surface, tuple[int, int]]]):
+        """warns about the background or sprite surfaces that are not in the display format"""
+        if not is_display_format(self._background):
+            warnings.warn(f"background of {self} is not in the display format", stacklevel=2)
+        for sprite, (surface, _pos) in zip(sprites, blits):
+            if not is_display_format(surface):
+                warnings.warn(f"surface of {sprite} in {self} is not in the display format", stacklevel=2)
+
+    def convert_surfaces(self) -> None:
+        """converts the surfaces of this gui and everything in it to the current display format"""
+        super().convert_surfaces()
+        cached = next((key for key, surface in self.background_cache.items() if surface is self._background), None)
+        shared = self._background is self.source_image
+        self.source_image = to_display_format(self.source_image)
+        self.background_cache = {key: to_display_format(surface) for key, surface in self.background_cache.items()}
+        if shared:
+            self._background = self.source_image
+        elif cached is not None:
+            self._background = self.background_cache[cached]
+        else:
+            self._background = to_display_format(self._background)
+        for sprite in self.sprites:
+            sprite.convert_surfaces()
+
     def set_surface(self, background: pygame.surface.Surface, redraw_self: bool = False) -> None:
-        self.background = background.copy()
         self.source_image = background.copy()
+        self._background = self.source_image
+        self.background_cache.clear()
+        if self.image.get_size() != background.get_size():
+            self.image = background.copy()
         self.rect.update(self.rect.left, self.rect.top, background.get_width(), background.get_height())
         self._update_pos()
         if redraw_self:
@@ -556,7 +806,7 @@ class GUI(GUISprite):
         self.buttons.clear()
         self.sub_GUIs.clear()
         self.sprites.clear()
-        self.background = self.source_image.copy()
+        self._background = self.scaled_background(self.rect.size)
 
     # other
 
@@ -565,14 +815,14 @@ class GUI(GUISprite):
         # localize the hit point
         hit_point = (pos[0]-self.rect.left, pos[1]-self.rect.top)
         # first check for submenus
-        for menu in self.sub_GUIs:
+        for menu in self.visible_sprites(self.sub_GUIs):
             hit = menu.rect.collidepoint(hit_point) and menu.hit_reg(hit_point)
             if hit:
                 self.focus = menu
                 return hit
 
         # after that check buttons
-        for button in self.buttons:
+        for button in self.visible_sprites(self.buttons):
             if button.is_hit(hit_point):
                 self.focus = button
                 return button
@@ -600,51 +850,200 @@ class GUI(GUISprite):
             return self.focus.get_focus()
         return self.focus
 
+    def get_scroll_panel(self, pos: tuple[int, int]) -> "ScrollPanel | None":
+        """finds the deepest scroll panel at the given position"""
+        hit_point = (pos[0]-self.rect.left, pos[1]-self.rect.top)
+        for menu in self.sub_GUIs:
+            panel = menu.rect.collidepoint(hit_point) and menu.get_scroll_panel(hit_point)
+            if panel:
+                return panel
+        return None
+
+    def memory_usage(self, seen: set[int] | None = None) -> int:
+        """returns the amount of bytes used by the surfaces of this gui and everything in it.
+        shared surfaces are only counted once"""
+        if seen is None:
+            seen = set()
+        total = sum(surface_bytes(surface, seen) for surface in (self.image, self._background, self.source_image,
+                                                                  *self.background_cache.values()))
+        return total + sum(sprite.memory_usage(seen) for sprite in self.sprites)
+
+    def memory_report(self, depth: int = 0) -> list[tuple[int, str, int]]:
+        """returns (depth, name, bytes) for this gui and every sub gui. each entry covers the whole subtree"""
+        report = [(depth, self.name, self.memory_usage())]
+        for menu in self.sub_GUIs:
+            report.extend(menu.memory_report(depth+1))
+        return report
+
+
+class ScrollPanel(GUI):
+    """gui that shows part of a larger content area. children are positioned inside the content area and
+    only the ones inside the visible part are drawn or hit. scrolls with the mouse wheel or by dragging."""
+    __slots__ = ("content_size", "scroll", "scroll_speed", "drag_start")
+
+    def __init__(self, pos: tuple[int | float, int | float], background: pygame.Surface,
+                 content_size: Sequence[int, int], priority=25, name="scroll panel", use_viewport: bool = True,
+                 alignment: Sequence[int, int] = K_ALIGN_CENTER, scroll_speed=20, *groups: pygame.sprite.Group):
+        super().__init__(pos, background, priority, name, use_viewport, alignment, *groups)
+        self.content_size: tuple[int, int] = (max(content_size[0], self.rect.width),
+                                              max(content_size[1], self.rect.height))
+        self.scroll: list[int, int] = [0, 0]  # top left of the visible area in content coordinates
+        self.scroll_speed = scroll_speed  # pixels per wheel step
+        self.drag_start: tuple[tuple[int, int], tuple[int, int]] | None = None  # mouse position, scroll
+
+    def content_rect(self) -> pygame.rect.Rect:
+        return pygame.Rect(self.rect.left-self.scroll[0], self.rect.top-self.scroll[1], *self.content_size)
+
+    def visible_rect(self) -> pygame.rect.Rect:
+        """the visible area in content coordinates"""
+        return pygame.Rect(self.scroll, self.rect.size)
+
+    def resize(self, size: Sequence[int, int]) -> None:
+        super().resize(size)
+        self.set_content_size(self.content_size)  # the content can`t be smaller than the panel
+
+    def set_content_size(self, content_size: Sequence[int, int]) -> None:
+        self.content_size = (max(content_size[0], self.rect.width), max(content_size[1], self.rect.height))
+        for sprite in self.sprites:
+            sprite._update_pos()
+        self.set_scroll(self.scroll)
+
+    def set_scroll(self, scroll: Sequence[int | float, int | float]) -> None:
+        self.scroll = [int(pygame.math.clamp(scroll[i], 0, self.content_size[i]-self.rect.size[i])) for i in range(2)]
+
+    def scroll_by(self, x: int | float, y: int | float) -> None:
+        self.set_scroll((self.scroll[0]+x, self.scroll[1]+y))
+
+    def on_scroll(self, event: pygame.event.Event):
+        self.scroll_by(event.precise_x*self.scroll_speed, -event.precise_y*self.scroll_speed)
+
+    def start_drag(self, pos: tuple[int, int]):
+        self.drag_start = (tuple(pos), tuple(self.scroll))
+
+    def drag(self, pos: tuple[int, int]):
+        if self.drag_start is None:
+            return
+        (x, y), (scroll_x, scroll_y) = self.drag_start
+        self.set_scroll((scroll_x+x-pos[0], scroll_y+y-pos[1]))
+
+    def stop_drag(self):
+        self.drag_start = None
+
+    def filled_surface(self) -> pygame.Surface:
+        """returns a surface filled with the visible elements."""
+        self.image.blit(self._background, (0, 0))
+        visible = self.visible_sprites(self.sprites)
+        offset = (-self.scroll[0], -self.scroll[1])
+        blits = [(sprite.filled_surface(), sprite.rect.move(offset).topleft) for sprite in visible]
+        if CHECK_FORMATS:
+            self.check_formats(visible, blits)
+        self.image.blits(blits, False)
+        return self.image
+
+    def _to_content(self, pos: tuple[int, int]) -> tuple[int, int] | None:
+        """translates a position to the coordinates hit_reg of GUI expects. None if outside the visible area"""
+        if not self.visible_rect().collidepoint(pos[0]-self.rect.left+self.scroll[0],
+                                                pos[1]-self.rect.top+self.scroll[1]):
+            return None
+        return pos[0]+self.scroll[0], pos[1]+self.scroll[1]
+
+    def hit_reg(self, pos: tuple[int, int]) -> Button | TextBox | Dropdown | None:
+        """same as GUI.hit_reg but only the visible elements can be hit"""
+        content_pos = self._to_content(pos)
+        return None if content_pos is None else super().hit_reg(content_pos)
+
+    def still_focused(self, pos: tuple[int, int]) -> bool:
+        content_pos = self._to_content(pos)
+        return False if content_pos is None else super().still_focused(content_pos)
+
+    def get_scroll_panel(self, pos: tuple[int, int]) -> "ScrollPanel | None":
+        content_pos = self._to_content(pos)
+        if content_pos is None:
+            return None
+        return super().get_scroll_panel(content_pos) or self
+
 
 class Screen(GUI):
     """top level gui. always contains the screen as its image"""
+    __slots__ = ("fullscreen", "small_size", "backend")
+
     def __init__(self, display: pygame.Surface, background: pygame.Surface | None = None, priority=100,
                  name="screen", fullscreen=True, *groups: pygame.sprite.Group):
         super().__init__((0, 0), display, priority, name, False, K_TOP_LEFT, *groups)
-        self.background = display.copy() if background is None else background.copy()
-        self.source_image = display.copy() if background is None else background.copy()
+        self.backend: RenderBackend = SurfaceBackend()  # draws the screen. see set_backend
+        self.scale_mode = K_SCALE_NONE  # the background is drawn unscaled at the top left
+        if background is not None:  # otherwise the copy of the display made by GUI is used
+            self.source_image = background.copy()
+            self._background = self.scaled_background(self.rect.size)
         self.fullscreen = fullscreen
         self.small_size = (ceil(self.rect.width*0.5), ceil(self.rect.height*0.5)) if fullscreen else self.rect.size
 
     def set_surface(self, background: pygame.surface.Surface, redraw_self: bool = False) -> None:
-        self.background = background.copy()
         self.source_image = background.copy()
+        self.background_cache.clear()
+        self._background = self.scaled_background(self.rect.size)
         if redraw_self:
-            pass
+            self.draw_screen()
 
     def toggle_fullscreen(self):
         """toggle the display between fullscreen and windowed mode"""
         self.fullscreen = not self.fullscreen
-        old_surface = self.image.copy()
         if self.fullscreen:
             self.small_size = self.rect.size
-            self.image = pygame.display.set_mode(flags=pygame.FULLSCREEN)
+            self.image = self.backend.set_mode(flags=pygame.FULLSCREEN)
         else:
-            self.image = pygame.display.set_mode(self.small_size, flags=pygame.RESIZABLE)
+            self.image = self.backend.set_mode(self.small_size, flags=pygame.RESIZABLE)
+        self.convert_surfaces()
+        self.fit_display()
+        self.draw_screen()
+
+    def resize(self, size: Sequence[int, int]) -> None:
+        """changes the size of the window"""
+        if tuple(size) != self.image.get_size():
+            self.image = self.backend.set_mode(size, flags=pygame.RESIZABLE)
+            self.convert_surfaces()
+        self.fit_display()
+
+    def fit_display(self) -> None:
+        """updates the size, background and element positions to the current display surface.
+        should be called after the window is resized"""
+        self.image = self.backend.get_surface()
         self.update_rect()
-        self.image.blit(old_surface, (0, 0))
-        pygame.display.flip()
+        self._background = self.scaled_background(self.rect.size)
+        for sprite in self.sprites:
+            sprite._update_pos()
 
     def center_background(self):
+        """centers the unscaled background on the display. the current background stays visible around it"""
         self.update_rect()
+        if self.source_image.get_width() >= self.rect.width and self.source_image.get_height() >= self.rect.height:
+            self._background = self.scaled_background(self.rect.size, K_SCALE_CENTER)  # nothing around it
+            return
         source_rect = self.source_image.get_rect()
         source_rect.center = self.rect.center
-        if self.background.get_size() != self.image.get_size():
-            self.background = self.image.copy()
-        self.background.blit(self.source_image, source_rect.topleft)
+        if self._background.get_size() != self.image.get_size():
+            self._background = self.image.copy()
+        self.own_background().blit(self.source_image, source_rect.topleft)
+
+    def convert_surfaces(self) -> None:
+        """converts everything except the display itself to the current display format"""
+        image = self.image
+        super().convert_surfaces()
+        self.image = image
 
     def update_rect(self):
         self.rect.size = self.image.get_size()
 
+    def set_backend(self, backend: RenderBackend) -> None:
+        """changes how the screen is drawn. SurfaceBackend blits into the display surface, RendererBackend
+        draws textures with a SDL2 renderer"""
+        self.backend = backend
+        self.fit_display()
+
     def draw_screen(self, flip: bool = True) -> None:
-        self.filled_surface()
+        self.backend.draw(self)
         if flip:
-            pygame.display.flip()
+            self.backend.flip()
 
 
-__all__ = ["GUISprite", "Button", "TextBox", "Dropdown", "GUI", "Screen"]
+__all__ = ["GUISprite", "Button", "TextBox", "Dropdown", "GUI", "ScrollPanel", "Screen"]
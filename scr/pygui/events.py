@@ -1,7 +1,8 @@
 import pygame.event
 import pygame.surface
 import pygame.display
-from pygui.elements import GUI, TextBox, Dropdown, Screen
+from pygui.functions import mouse_pos, mouse_pressed
+from pygui.elements import GUI, TextBox, Dropdown, ScrollPanel, Screen
 
 DRAW_SCREEN = pygame.event.custom_type()
 display: Screen
@@ -11,7 +12,7 @@ def init(screen: pygame.Surface, background_image: pygame.Surface | None = None,
     global display, event_functions
     display = Screen(screen, background_image, fullscreen=fullscreen)
     pygame.event.set_allowed((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.KEYDOWN,
-                              pygame.KEYUP, pygame.QUIT, DRAW_SCREEN))
+                              pygame.KEYUP, pygame.QUIT, pygame.VIDEORESIZE, DRAW_SCREEN))
     event_functions[DRAW_SCREEN] = display.draw_screen
     return display
 
@@ -19,9 +20,13 @@ def init(screen: pygame.Surface, background_image: pygame.Surface | None = None,
 def handle_events():
     """should be called once per frame to handle internal ui stuff. can also take over the main event loop by adding
     functions to event_functions"""
+    if recorder is not None:
+        recorder.next_frame()
     for event in pygame.event.get():
         if pygame.event.get_blocked(event.type):  # sometimes events are still posted when blocked.
             continue
+        if recorder is not None:
+            recorder.record(event)
         try:
             event_function = event_functions[event.type]
         except KeyError:
@@ -33,6 +38,8 @@ def handle_events():
 def handle_single(event: pygame.event.Event):
     if pygame.event.get_blocked(event.type):  # sometimes events are still posted when blocked.
         return
+    if recorder is not None:
+        recorder.record(event)
     try:
         event_function = event_functions[event.type]
     except KeyError:
@@ -43,6 +50,7 @@ def handle_single(event: pygame.event.Event):
 
 def on_mouse_press(event: pygame.event.Event):
     """"checks if any buttons are hit"""
+    global dragged_panel
     if event.button != 1:
         return
     focus = display.get_focus()
@@ -53,12 +61,21 @@ def on_mouse_press(event: pygame.event.Event):
 
     if result:
         result.press()
+    else:  # start dragging the scroll panel under the mouse
+        dragged_panel = display.get_scroll_panel(event.pos)
+        if dragged_panel is not None:
+            dragged_panel.start_drag(event.pos)
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
 
 
 def on_mouse_release(event: pygame.event.Event):
     """activates any held buttons"""
     if event.button != 1:
         return
+    global dragged_panel
+    if dragged_panel is not None:
+        dragged_panel.stop_drag()
+        dragged_panel = None
     if display.still_focused(event.pos):
         display.click()
         if not display.get_focus().active:
@@ -70,7 +87,11 @@ def on_mouse_release(event: pygame.event.Event):
 
 def on_mouse_move(event: pygame.event.Event):
     """monitors if buttons are still held down"""
-    if display.focus is None or not pygame.mouse.get_pressed()[0]:
+    if dragged_panel is not None and event.buttons[0]:
+        dragged_panel.drag(event.pos)
+        pygame.event.post(pygame.event.Event(DRAW_SCREEN))
+        return
+    if display.focus is None or not event.buttons[0]:
         return
     if not display.still_focused(event.pos):
         pygame.event.set_blocked(pygame.MOUSEMOTION)
@@ -82,6 +103,11 @@ def on_scroll(event: pygame.event.Event):
     focus = display.get_focus()
     if isinstance(focus, Dropdown) and focus.active:
         focus.on_scroll(event)
+        return
+    panel = display.get_scroll_panel(mouse_pos())
+    if panel is not None:
+        panel.on_scroll(event)
+        pygame.event.post(pygame.event.Event(DRAW_SCREEN))
 
 
 def on_key_press(event):
@@ -95,13 +121,21 @@ def on_key_release(_event):
     pass
 
 
+def on_resize(_event):
+    display.fit_display()
+    pygame.event.post(pygame.event.Event(DRAW_SCREEN))
+
+
 active_element = None
+dragged_panel: ScrollPanel | None = None
+recorder = None  # pygui.replay.Recorder that records the handled events. set by replay.start_recording
 
 
 event_functions = {pygame.MOUSEBUTTONDOWN: on_mouse_press, pygame.MOUSEBUTTONUP: on_mouse_release,
                    pygame.MOUSEMOTION: on_mouse_move, pygame.MOUSEWHEEL: on_scroll,
-                   pygame.KEYDOWN: on_key_press, pygame.KEYUP: on_key_release}
+                   pygame.KEYDOWN: on_key_press, pygame.KEYUP: on_key_release, pygame.VIDEORESIZE: on_resize}
 
 
 __all__ = ["init", "event_functions", "handle_events", "DRAW_SCREEN", "on_mouse_press", "on_mouse_release",
-           "on_mouse_move", "on_scroll", "on_key_press", "on_key_release", "handle_single"]
+           "on_mouse_move", "on_scroll", "on_key_press", "on_key_release", "on_resize", "handle_single", "mouse_pos",
+           "mouse_pressed"]
@@ -1,5 +1,64 @@
+import weakref
 import pygame
 
+K_SCALE_STRETCH = 0  # scale to the exact size, ignoring the aspect ratio
+K_SCALE_FIT = 1  # scale to fit inside the size, the remaining area is filled with a color
+K_SCALE_FILL = 2  # scale to cover the size, the overflow is cropped
+K_SCALE_CENTER = 3  # don`t scale, only center
+K_SCALE_NONE = 4  # don`t scale, place at the top left
+
+# (position, pressed buttons) returned by mouse_pos and mouse_pressed instead of the real mouse. set by replay
+mouse_override: tuple[tuple[int, int], tuple[bool, bool, bool]] | None = None
+
+# surface: number of times it was marked as changed. lets backends find out which textures are outdated
+_surface_versions: weakref.WeakKeyDictionary[pygame.Surface, int] = weakref.WeakKeyDictionary()
+
+# (bitsize, masks) of the display and of convert_alpha, stored per display format
+_display_formats: dict[tuple, tuple[tuple, tuple]] = {}
+
+
+def mouse_pos() -> tuple[int, int]:
+    """position of the mouse. use this instead of pygame.mouse.get_pos so recorded input can be replayed"""
+    return pygame.mouse.get_pos() if mouse_override is None else mouse_override[0]
+
+
+def mouse_pressed() -> tuple[bool, bool, bool]:
+    """pressed mouse buttons. use this instead of pygame.mouse.get_pressed so recorded input can be replayed"""
+    return pygame.mouse.get_pressed() if mouse_override is None else mouse_override[1]
+
+
+def get_display_formats() -> tuple[tuple, tuple] | None:
+    """returns the (bitsize, masks) pixel formats of converted opaque and alpha surfaces.
+    None when no display mode is set"""
+    display = pygame.display.get_surface()
+    if display is None:
+        return None
+    key = (display.get_bitsize(), display.get_masks())
+    try:
+        return _display_formats[key]
+    except KeyError:
+        alpha = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        formats = _display_formats[key] = (key, (alpha.get_bitsize(), alpha.get_masks()))
+        return formats
+
+
+def is_display_format(surface: pygame.Surface) -> bool:
+    """checks if the surface can be blitted to the display without converting pixels"""
+    formats = get_display_formats()
+    if formats is None:  # nothing to convert to
+        return True
+    return (surface.get_bitsize(), surface.get_masks()) == formats[1 if surface.get_flags() & pygame.SRCALPHA else 0]
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """returns the surface converted to the display format. surfaces already in that format are returned as is.
+    per pixel alpha is kept, colorkey and surface alpha are kept by convert."""
+    if is_display_format(surface):
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
 
 def colored_rect(color, size, transparent=False, srcalpha=False):
     """creates a simple rectangle with the given color."""
@@ -10,13 +69,13 @@ def colored_rect(color, size, transparent=False, srcalpha=False):
     surface.fill(color)
     if transparent:
         surface.set_colorkey(color)
-    return surface
+    return to_display_format(surface)
 
 
 def comp_text_box(length: int):
     """creates a textbox from the text box image at the given length."""
     path = __file__[0:__file__.rfind("\\")]
-    surface = colored_rect((0, 0, 0), (length, 40), True).convert_alpha()
+    surface = colored_rect((0, 0, 0, 0), (length, 40), srcalpha=True)
     side_image = get_img("text_box_side", path)
     surface.blits([(side_image, (0, 0)), (pygame.transform.scale(get_img("text_box_line", path), (length-16, 40)),
                                           (8, 0)),
@@ -25,19 +84,23 @@ def comp_text_box(length: int):
 
 
 def get_img(name: str, folder: str | None = None, alpha=True, extension=".png") -> pygame.Surface:
-    """returns a converted image from the texture`s folder. alpha optional"""
+    """returns a converted image from the texture`s folder. alpha optional.
+    the image is not converted when no display mode is set, like with RendererBackend"""
     if folder is not None:
         name = rf"{folder}\{name}"
+    image = pygame.image.load(name + extension)
+    if pygame.display.get_surface() is None:  # nothing to convert to
+        return image
     if alpha:
-        return pygame.image.load(name + extension).convert_alpha()
+        return image.convert_alpha()
     else:
-        return pygame.image.load(name + extension).convert()
+        return image.convert()
 
 
 def center_text(text: str, surface: pygame.Surface, font: pygame.font.Font,
                 color=(255, 255, 255), pos=(0.5, 0.5), smooth=True) -> pygame.Surface:
     """"blits text centered on the given surface and returns that surface"""
-    text_surface = font.render(text, smooth, color)
+    text_surface = to_display_format(font.render(text, smooth, color))
     surface_rect = surface.get_rect()
     text_rect = text_surface.get_rect()
     text_rect.center = (round(surface_rect.width*pos[0]), round(surface_rect.height*pos[1]))
@@ -46,6 +109,47 @@ def center_text(text: str, surface: pygame.Surface, font: pygame.font.Font,
     return compound
 
 
+def scale_surface(surface: pygame.Surface, size: tuple[int, int], mode: int = K_SCALE_STRETCH,
+                  color=(0, 0, 0)) -> pygame.Surface:
+    """returns a new surface of the given size with the surface scaled onto it using one of the K_SCALE modes.
+    areas not covered are filled with color, or left transparent for surfaces with per pixel alpha."""
+    width, height = surface.get_size()
+    if mode == K_SCALE_STRETCH:
+        scaled = size
+    elif mode == K_SCALE_FIT:
+        factor = min(size[0]/width, size[1]/height)
+        scaled = (round(width*factor), round(height*factor))
+    elif mode == K_SCALE_FILL:
+        factor = max(size[0]/width, size[1]/height)
+        scaled = (round(width*factor), round(height*factor))
+    else:
+        scaled = (width, height)
+
+    if scaled != (width, height):
+        # smoothscale only works on 24 and 32 bit surfaces
+        surface = (pygame.transform.smoothscale if surface.get_bitsize() >= 24 else pygame.transform.scale)(
+            surface, scaled)
+    elif scaled == tuple(size):
+        surface = surface.copy()
+    if scaled == tuple(size):
+        return to_display_format(surface)
+
+    srcalpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    result = colored_rect((0, 0, 0, 0) if srcalpha else color, size, srcalpha=srcalpha)
+    result.blit(surface, (0, 0) if mode == K_SCALE_NONE else ((size[0]-scaled[0])//2, (size[1]-scaled[1])//2))
+    return result
+
+
+def mark_changed(surface: pygame.Surface) -> None:
+    """marks a surface as drawn on after it was created, so backends that keep a copy of it update that copy"""
+    _surface_versions[surface] = _surface_versions.get(surface, 0)+1
+
+
+def surface_version(surface: pygame.Surface) -> int:
+    """returns how many times the surface was marked as changed"""
+    return _surface_versions.get(surface, 0)
+
+
 def safe_subsurface(parent_surface: pygame.Surface, area: pygame.Rect) -> pygame.Surface:
     """unlike getting a subsurface normally this function returns new surface that does not
     share its pixels with the original surface"""
@@ -57,4 +161,19 @@ def safe_subsurface(parent_surface: pygame.Surface, area: pygame.Rect) -> pygame
     return child_surface
 
 
-__all__ = ["colored_rect", "comp_text_box", "get_img", "center_text", "safe_subsurface"]
+def surface_bytes(surface: pygame.Surface, seen: set[int] | None = None) -> int:
+    """returns the amount of bytes used by the pixels of a surface. subsurfaces don`t own pixels and count as 0.
+    when a set is given, surfaces already in it are skipped and new surfaces are added to it."""
+    if seen is not None:
+        if id(surface) in seen:
+            return 0
+        seen.add(id(surface))
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch()*surface.get_height()
+
+
+__all__ = ["mouse_pos", "mouse_pressed", "get_display_formats", "is_display_format", "to_display_format",
+           "colored_rect", "comp_text_box", "get_img", "center_text", "scale_surface", "safe_subsurface",
+           "mark_changed", "surface_version", "surface_bytes", "K_SCALE_STRETCH", "K_SCALE_FIT", "K_SCALE_FILL",
+           "K_SCALE_CENTER", "K_SCALE_NONE"]
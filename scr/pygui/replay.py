@@ -0,0 +1,107 @@
+import gzip
+import json
+import time
+from math import ceil
+import pygame
+from pygui import events, functions
+
+Mouse = tuple[tuple[int, int], tuple[bool, bool, bool]]  # position, pressed buttons
+
+
+class Recorder:
+    """writes the events handled by pygui to a gzip compressed file. one line per event:
+    [time in ms, frame, event type, mouse position, pressed mouse buttons, event attributes]"""
+    __slots__ = ("file", "start", "frame")
+
+    def __init__(self, path: str):
+        self.file = gzip.open(path, "wt", encoding="utf-8")
+        self.start = time.perf_counter()
+        self.frame = 0
+
+    def record(self, event: pygame.event.Event) -> None:
+        # custom event types are not the same in every program, so the draw event is stored by name
+        event_type = "draw" if event.type == events.DRAW_SCREEN else event.type
+        attributes = {key: value for key, value in event.dict.items() if _serializable(value)}
+        line = [round((time.perf_counter()-self.start)*1000, 3), self.frame, event_type, functions.mouse_pos(),
+                functions.mouse_pressed()[:3], attributes]
+        self.file.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+    def next_frame(self) -> None:
+        """called by handle_events. call it once per frame when only handle_single is used"""
+        self.frame += 1
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _serializable(value) -> bool:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    return isinstance(value, (tuple, list)) and all(isinstance(item, (int, float)) for item in value)
+
+
+def start_recording(path: str) -> Recorder:
+    """starts recording every event handled by handle_events and handle_single to the given file"""
+    stop_recording()
+    events.recorder = Recorder(path)
+    return events.recorder
+
+
+def stop_recording() -> None:
+    if events.recorder is not None:
+        events.recorder.close()
+        events.recorder = None
+
+
+def load_recording(path: str) -> list[list[tuple[float, pygame.event.Event, Mouse]]]:
+    """returns the recorded frames as lists of (time in ms, event, (mouse position, pressed mouse buttons))"""
+    frames: list[list[tuple[float, pygame.event.Event, Mouse]]] = []
+    last_frame = None
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            timestamp, frame, event_type, mouse_pos, mouse_pressed, attributes = json.loads(line)
+            if frame != last_frame:
+                frames.append([])
+                last_frame = frame
+            attributes = {key: tuple(value) if isinstance(value, list) else value
+                          for key, value in attributes.items()}
+            event = pygame.event.Event(events.DRAW_SCREEN if event_type == "draw" else event_type, attributes)
+            frames[-1].append((timestamp, event, (tuple(mouse_pos), tuple(mouse_pressed))))
+    return frames
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """nearest rank percentile of already sorted values"""
+    if not values:
+        return 0.0
+    return values[min(len(values)-1, max(0, ceil(percent*len(values)/100)-1))]
+
+
+def replay(path: str, draw_frames: bool = False) -> dict[str, float]:
+    """feeds a recording through the event functions as fast as possible and returns the frame times in ms.
+    pygui has to be initialized with the same layout as during the recording. while replaying, mouse_pos and
+    mouse_pressed return the recorded mouse state instead of the real mouse, so it also works headless.
+    when draw_frames is true the screen is drawn after every frame, otherwise only recorded draw events draw."""
+    frames = load_recording(path)
+    frame_times: list[float] = []
+    try:
+        for frame in frames:
+            start = time.perf_counter()
+            for _timestamp, event, mouse in frame:
+                functions.mouse_override = mouse
+                events.handle_single(event)
+            if draw_frames:
+                events.display.draw_screen(False)
+            frame_times.append((time.perf_counter()-start)*1000)
+            pygame.event.clear()  # events posted by the handlers are part of the recording already
+    finally:
+        functions.mouse_override = None
+
+    frame_times.sort()
+    return {"frames": len(frame_times), "events": sum(len(frame) for frame in frames),
+            "total_ms": sum(frame_times), "mean_ms": sum(frame_times)/len(frame_times) if frame_times else 0.0,
+            "p50_ms": percentile(frame_times, 50), "p90_ms": percentile(frame_times, 90),
+            "p99_ms": percentile(frame_times, 99), "max_ms": frame_times[-1] if frame_times else 0.0}
+
+
+__all__ = ["Recorder", "start_recording", "stop_recording", "load_recording", "percentile", "replay"]